@@ -0,0 +1,13 @@
+from scipy.io.wavfile import read as read_wav
+
+
+def test_audio(path='ahoj-svete-8000-mono.wav'):
+    w = read_wav(path)
+    rate = w[0]
+    data = w[1]
+    position = 0
+    chunk_size = int(0.125 * rate)
+    while position != data.size:
+        chunk = data[position:(position+chunk_size)]
+        position = position + chunk.size
+        yield bytes(chunk)
@@ -1,5 +1,14 @@
-import sys as _sys
-import os as _os
-_sys.path.append(_os.path.join(_os.path.abspath(_os.path.dirname(__file__)), 'ntx_protobuf'))  # Python yuck
+# The heavy lifting (grpc, protobufs, aiohttp) is imported on the first attribute access only,
+# so a bare `import ntx_python` stays cheap for short-lived processes.
+__all__ = ['NewtonEngine', 'to_strings']
 
-from .ntx_stt import NewtonEngine, to_strings
+
+def __getattr__(name):
+    if name in __all__:
+        from . import ntx_stt
+        return getattr(ntx_stt, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -1,22 +1,10 @@
 from ntx_python.ntx_stt import NewtonEngine, to_strings
-from scipy.io.wavfile import read as read_wav
+from ntx_python.__audio__ import test_audio
 import logging, sys
 logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
 logging.getLogger('ntx_python').setLevel(logging.INFO)
 
 
-def test_audio(path='ahoj-svete-8000-mono.wav'):
-    w = read_wav(path)
-    rate = w[0]
-    data = w[1]
-    position = 0
-    chunk_size = int(0.125 * rate)
-    while position != data.size:
-        chunk = data[position:(position+chunk_size)]
-        position = position + chunk.size
-        yield bytes(chunk)
-
-
 if __name__ == '__main__':
     sys.argv = sys.argv[1:]
     from ntx_python.__config__ import DOMAIN, AUDIENCE, USERNAME, PASSWORD, ID, LABEL, TOKEN
@@ -35,6 +23,8 @@ if __name__ == '__main__':
         'auth': auth_conf
     }
     with NewtonEngine(conf) as engine:
-        for txt in to_strings(engine.recognize(test_audio(sys.argv[0]))):
+        engine.warm_up()  # Logging in and connecting while the audio is being loaded
+        audio = list(test_audio(sys.argv[0]))
+        for txt in to_strings(engine.recognize(iter(audio))):
             print(txt, flush=True, end='')
         print()
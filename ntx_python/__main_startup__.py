@@ -0,0 +1,47 @@
+from time import perf_counter
+import subprocess
+import sys
+
+
+def measure_import(statement, repeat=5):
+    """Best of `repeat` fresh interpreters, so no module is cached"""
+    timer = f'from time import perf_counter as t; s = t(); {statement}; print(t() - s)'
+    return min(float(subprocess.run([sys.executable, '-c', timer], check=True, capture_output=True, text=True).stdout)
+               for _ in range(repeat))
+
+
+def auth_conf(login):
+    from ntx_python.__config__ import AUDIENCE, USERNAME, PASSWORD, ID, LABEL, TOKEN
+    if not login:
+        return TOKEN
+    return {
+        'daemon': False,
+        'audience': AUDIENCE,
+        'username': USERNAME,
+        'password': PASSWORD,
+        'id': ID,
+        'label': LABEL}
+
+
+def main(path='ahoj-svete-8000-mono.wav', login=False):
+    print(f'import ntx_python: {measure_import("import ntx_python"):.3f} s')
+    print(f'from ntx_python import NewtonEngine: {measure_import("from ntx_python import NewtonEngine"):.3f} s')
+
+    from ntx_python.__config__ import DOMAIN
+    auth = auth_conf(login)
+    start = perf_counter()
+    from ntx_python import NewtonEngine
+    with NewtonEngine({'pnc': False, 'ppc': True, 'lookahead': False, 'domain': DOMAIN, 'auth': auth}) as engine:
+        engine.warm_up()
+        from ntx_python.__audio__ import test_audio
+        audio = list(test_audio(path))
+        print(f'Warmed up and audio loaded: {perf_counter() - start:.3f} s')
+        for _ in engine.recognize(iter(audio)):
+            print(f'Time to first label ({"login" if login else "static token"}): {perf_counter() - start:.3f} s')
+            break
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    login = '--login' in args
+    main(*(a for a in args if a != '--login'), login=login)
@@ -1,7 +1,7 @@
 from grpc import AuthMetadataPlugin, AuthMetadataContext, AuthMetadataPluginCallback
+from ntx_python.ntx_basic_metadata_plugin import BasicNewtonMetadataPlugin  # Backwards compatible re-export
 
 from threading import Thread
-import aiohttp
 import asyncio
 import json
 from time import time
@@ -84,6 +84,7 @@ class NewtonAuthMetadataPlugin:
 
     async def obtain(self, attempt: AttemptCondition, endpoint='/', body={}, headers={}):
         check(attempt.unexhausted())
+        import aiohttp  # Deferred, only the login flow needs it
         async with aiohttp.ClientSession() as session:
             request_body = json.dumps(body).encode()
             request_headers = {**headers, **self.conf['_default_headers']}
@@ -207,19 +208,3 @@ class UnderlyingMetadataPlugin(AuthMetadataPlugin):
         self.wait()
         callback((('ntx-token', self.authenticator.ntx_token.token.data),), None)
 
-
-class BasicNewtonMetadataPlugin(AuthMetadataPlugin):
-    def __init__(self, token: str):
-        self.token = token
-
-    def __call__(self, context: AuthMetadataContext, callback: AuthMetadataPluginCallback):
-        callback((('ntx-token', self.token),), None)
-
-    def wait(self):
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
@@ -0,0 +1,18 @@
+from grpc import AuthMetadataPlugin, AuthMetadataContext, AuthMetadataPluginCallback
+
+
+class BasicNewtonMetadataPlugin(AuthMetadataPlugin):
+    def __init__(self, token: str):
+        self.token = token
+
+    def __call__(self, context: AuthMetadataContext, callback: AuthMetadataPluginCallback):
+        callback((('ntx-token', self.token),), None)
+
+    def wait(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
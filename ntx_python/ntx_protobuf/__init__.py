@@ -0,0 +1,3 @@
+import sys as _sys
+import os as _os
+_sys.path.append(_os.path.abspath(_os.path.dirname(__file__)))  # Python yuck, the generated grpc module imports `engine_pb2` absolutely
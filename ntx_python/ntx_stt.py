@@ -6,7 +6,7 @@ import grpc
 from ntx_python.ntx_protobuf.engine_pb2 import EngineStream, EngineContext, EngineContextStart, EngineContextEnd, EventsPush, Events, Event, Lexicon, AudioFormat
 from ntx_python.ntx_protobuf.engine_pb2_grpc import EngineServiceStub
 
-from ntx_python.ntx_auth_metadata_plugin import NewtonAuthMetadataPlugin, UnderlyingMetadataPlugin, BasicNewtonMetadataPlugin
+from ntx_python.ntx_basic_metadata_plugin import BasicNewtonMetadataPlugin
 
 
 #Python is a little different – the Python compiler generates a module with a static descriptor of each message type in your .proto, which is then used with a metaclass to create the necessary Python data access class at runtime.
@@ -25,7 +25,7 @@ def join(gen_of_gens: Iterator[Iterator[Any]]) -> Iterator[Any]:
 
 
 class UnderlyingNewtonEngine:
-    def __init__(self, config, creds_plugin: UnderlyingMetadataPlugin):
+    def __init__(self, config, creds_plugin: grpc.AuthMetadataPlugin):
         self.config = config
         self.creds_plugin = creds_plugin
         self.finished = ThreadEvent()
@@ -35,10 +35,12 @@ class UnderlyingNewtonEngine:
         call_cred = grpc.metadata_call_credentials(self.creds_plugin)
         composed_creds = grpc.composite_channel_credentials(ssl_cred, call_cred)
         self._channel = grpc.secure_channel(f'{self.config["domain"]}:443', composed_creds)
+        self._ready = grpc.channel_ready_future(self._channel)  # Connecting in the background
         self.stub = EngineServiceStub(self._channel)
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
+        self._ready.cancel()
         self._channel.close()
 
     def _start(self):
@@ -136,25 +138,46 @@ class NewtonEngine:
             'format': AudioFormat.AUDIO_SAMPLE_FORMAT_S16LE,
             'channels': AudioFormat.AUDIO_CHANNEL_LAYOUT_MONO,
             **conf}
-        self._stream = self._create()
-        next(self._stream)  # Priming, initializing `with` objects
+        self._stream = None  # Created by `warm_up`, at the latest by the first `recognize`
+        self._stopped = False
+
+    def warm_up(self):
+        """Starts logging in and connecting without blocking, e.g. while the audio is being loaded"""
+        if self._stopped:
+            raise RuntimeError('NewtonEngine has been stopped')
+        if self._stream is None:
+            stream = self._create()
+            next(stream)  # Priming, initializing `with` objects
+            self._stream = stream
 
     def recognize(self, feeder: Iterator[bytes]) -> Iterator[str]:
-        responder = self._stream.send(feeder)
-        next(self._stream)  # Advancing back to arguments
+        self.warm_up()
+        try:
+            responder = self._stream.send(feeder)
+            next(self._stream)  # Advancing back to arguments
+        except BaseException:
+            self._stream = None  # The generator is finished, e.g. by a failed login, the next call starts over
+            raise
         return responder
 
     def _create(self):
-        with (NewtonAuthMetadataPlugin(self.conf['auth'])
-                if isinstance(self.conf['auth'], dict)
-                else BasicNewtonMetadataPlugin(self.conf['auth'])) as self._auth_plugin:
+        if isinstance(self.conf['auth'], dict):
+            from ntx_python.ntx_auth_metadata_plugin import NewtonAuthMetadataPlugin
+            auth_plugin = NewtonAuthMetadataPlugin(self.conf['auth'])
+        else:
+            auth_plugin = BasicNewtonMetadataPlugin(self.conf['auth'])
+        with auth_plugin as self._auth_plugin:
             with UnderlyingNewtonEngine(self.conf, self._auth_plugin) as self._engine:
-                self._auth_plugin.wait()  # Obtaining access
+                feeder = (yield)
+                self._auth_plugin.wait()  # Obtaining access, deferred until the first recognition
                 while True:
-                    yield self._engine.send_audio_chunks((yield))
+                    yield self._engine.send_audio_chunks(feeder)
+                    feeder = (yield)
 
     def stop(self):
-        self._stream.close()
+        self._stopped = True
+        if self._stream is not None:
+            self._stream.close()
 
     def __del__(self):
         self.stop()